@@ -4,17 +4,23 @@ df = df.with_columns(
     pl.col("BuyDate").cast(pl.Date)
 )
 
-# But more commonly:
-buys = buys.with_columns(
-    pl.col("BuyDate").str.strptime(pl.Date, "%Y-%m-%d") # instead of pl.Datetime
+# Prefer scan_csv + a lazy pipeline over read_csv + eager steps:
+# the optimizer pushes the null filter down so rows dropped by
+# drop_nulls never get their date strings parsed at all.
+
+buys = (
+    pl.scan_csv("buys.csv")
+    .with_columns(
+        # to_date with an explicit format hits the fast integer-parsing
+        # path; cache=False skips per-string hashing (values are unique
+        # enough that caching buys nothing here)
+        pl.col("BuyDate").str.to_date("%Y-%m-%d", exact=True, cache=False)
+    )
+    .drop_nulls(subset=["ID", "Date"])
+    .collect()
 )
 
 
-# DropNAS
-
-buys = buys.drop_nulls(subset=["ID", "Date"])
-
-
 # Join vs asof_join
 # Join is exact
 
@@ -1,16 +1,19 @@
-from datetime import datetime
-from collections import defaultdict
-
-
 times = ''
 hourly_wage = ''
 
+# Only 24*60 = 1440 valid "HH:MM" strings exist, so parsing becomes a
+# single dict lookup instead of slicing + int() + arithmetic per field.
+# Unpadded hours ("7:00") were accepted by the old strptime parse, so
+# those spellings get entries too.
+_HHMM = {f"{h:02d}:{m:02d}": h * 60 + m for h in range(24) for m in range(60)}
+_HHMM.update({f"{h}:{m:02d}": h * 60 + m for h in range(10) for m in range(60)})
+
 
 def process_time_ranges(lines: list[str]) -> tuple[int, int, dict]:
     total_minutes = 0
-    minutes_by_month = defaultdict(int)
-    fmt = "%H:%M"
-    
+    minutes_by_month = {}
+    get = minutes_by_month.get  # bind once, skip the attribute lookup per line
+
     for line in lines:
         try:
             # Example line: "21.10 17:00-20:15"
@@ -18,13 +21,10 @@ def process_time_ranges(lines: list[str]) -> tuple[int, int, dict]:
             day, month = map(int, date_str.split("."))
             start_str, end_str = time_range.split("-")
             start_str, end_str = start_str.strip(), end_str.strip()
-            
-            start_time = datetime.strptime(start_str, fmt)
-            end_time = datetime.strptime(end_str, fmt)
-            
-            minutes = int((end_time - start_time).total_seconds() // 60)
+
+            minutes = _HHMM[end_str] - _HHMM[start_str]
             total_minutes += minutes
-            minutes_by_month[month] += minutes
+            minutes_by_month[month] = get(month, 0) + minutes
         except Exception as e:
             print(f"Skipping line (bad format): {line} | Error: {e}")
     
@@ -32,13 +32,51 @@ def process_time_ranges(lines: list[str]) -> tuple[int, int, dict]:
     leftover = total_minutes % 45
     
     sessions_by_month = {
-        month: (minutes // 45, minutes % 45)
+        month: divmod(minutes, 45)
         for month, minutes in minutes_by_month.items()
     }
     
     return total_sessions, leftover, sessions_by_month
 
 
+def process_time_ranges_polars(lines: list[str]) -> tuple[int, int, dict]:
+    """Vectorized version of process_time_ranges for large inputs.
+
+    One regex extraction + one group_by instead of a Python-level loop,
+    so the per-line interpreter overhead disappears.
+    """
+    import polars as pl
+
+    df = (
+        # Pin the dtype so an empty list doesn't infer a Null column,
+        # which would make str.extract_groups raise
+        pl.DataFrame({"line": lines}, schema={"line": pl.String})
+        .with_columns(
+            pl.col("line")
+            .str.extract_groups(r"(\d+)\.(\d+)\s+(\d+):(\d+)-(\d+):(\d+)")
+            .struct.rename_fields(["day", "month", "sh", "sm", "eh", "em"])
+            .alias("parts")
+        )
+        .unnest("parts")
+        .drop_nulls("month")
+        .with_columns(pl.col("day", "month", "sh", "sm", "eh", "em").cast(pl.Int16))
+        .with_columns(
+            ((pl.col("eh") * 60 + pl.col("em")) - (pl.col("sh") * 60 + pl.col("sm")))
+            .alias("minutes")
+        )
+    )
+
+    total_minutes = int(df["minutes"].sum() or 0)
+    by_month = df.group_by("month").agg(pl.col("minutes").sum())
+
+    sessions_by_month = {
+        int(month): (minutes // 45, minutes % 45)
+        for month, minutes in by_month.iter_rows()
+    }
+
+    return total_minutes // 45, total_minutes % 45, sessions_by_month
+
+
 if __name__ == "__main__":
     print("Starting Script")
     lines = times.splitlines()
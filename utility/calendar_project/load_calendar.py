@@ -6,25 +6,27 @@ a simple display where each day that has at least one event is rendered as
 a square "card" containing the date and event summary lines.
 
 Requirements:
-    pip install ics
+    pip install icalendar
 
 How it works (high level):
 - load_ics_file: reads an .ics file and returns a list of parsed events.
-- group_events_by_date: groups events by local calendar date (YYYY-MM-DD).
+- group_events_by_date: groups events by local calendar date.
 - build_day_cards_gui: creates a Tkinter window and draws one square box per date.
 - The user can also pick another .ics file using the "Load .ics..." button.
 
 Author: ChatGPT
 """
 
+from operator import attrgetter
 from pathlib import Path
-from datetime import datetime, date
+from typing import NamedTuple, Optional
+from datetime import datetime, date, time as dt_time
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
-import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-from ics import Calendar
-import textwrap
-import regex as re
+import calendar
+import re
+
+# tkinter and icalendar are imported lazily inside the functions that
+# need them -- keeps headless use (and cold start) free of their cost
 
 # ------------------------------
 # Configuration / Defaults
@@ -35,54 +37,63 @@ DEFAULT_ICS_PATH = DEFAULT_DOWNLOADS / DEFAULT_ICS_FILENAME
 LOCAL_TZ_NAME = "Europe/Berlin"  # adjust if you want another default local tz
 TIMEZONE = ZoneInfo(LOCAL_TZ_NAME)
 
+# Pattern: "HH:MM-HH:MM DD.MM" -- compiled once instead of per findall call
+_EVENT_RE = re.compile(r"(\d{1,2}:\d{2})-(\d{1,2}:\d{2})\s*(\d{1,2}\.\d{1,2})")
+
+# Events starting before this time are titled "X1", later ones "X2"
+CUTOFF = dt_time(16, 30)
+
+# calendar.day_abbr/month_abbr call strftime on every __getitem__, so
+# snapshot them once -- card headers then index plain tuples
+_DAY_ABBR = tuple(calendar.day_abbr)
+_MONTH_ABBR = tuple(calendar.month_abbr)
+
+
+class Event(NamedTuple):
+    """One calendar event. Attribute access is C-level, unlike the
+    per-lookup hashing a dict would pay, and there is no dict overhead
+    per event."""
+    title: str
+    begin: datetime
+    end: Optional[datetime]
+
 # ------------------------------
 # Utility Functions (single-responsibility)
 # ------------------------------
-def get_local_zone() -> ZoneInfo:
-    """Return a ZoneInfo for the local timezone (fallback to system default)."""
-    try:
-        return ZoneInfo(LOCAL_TZ_NAME)
-    except Exception:
-        # If ZoneInfo for the named zone isn't available, fall back to system local tz via datetime
-        try:
-            return datetime.now().astimezone().tzinfo or ZoneInfo("UTC")
-        except Exception:
-            return ZoneInfo("UTC")
-
-
 def load_ics_file(path: Path) -> list:
     """
-    Read an .ics file and return a list of event dicts with keys:
-    - 'title' (str)
-    - 'begin' (datetime)
-    - 'end' (datetime or None)
+    Read an .ics file and return a list of Event tuples
+    (title, begin, end).
     """
+    from icalendar import Calendar
+
     if not path.exists():
         raise FileNotFoundError(f"ICS file not found: {path}")
 
-    text = path.read_text(encoding="utf-8")
-    cal = Calendar(text)
+    cal = Calendar.from_ical(path.read_bytes())
 
-    # Convert events into simple dicts
+    # Convert events into Event tuples
     events = []
-    local_tz = get_local_zone()
-    for ev in cal.events:
-        # The ics library exposes begin as arrow.Arrow like object; safe access:
-        try:
-            ev_begin = ev.begin.datetime  # may be tz-aware or naive
-        except Exception:
-            # fallback: use the raw .begin if needed
-            ev_begin = getattr(ev, "begin", None)
-        try:
-            ev_end = ev.end.datetime
-        except Exception:
-            ev_end = None
+    local_tz = TIMEZONE  # looked up once at module load, no per-call ZoneInfo
+    for ev in cal.walk("VEVENT"):
+        # icalendar hands back plain datetime/date objects -- no Arrow
+        # wrapping, no try/except per attribute
+        dtstart = ev.get("DTSTART")
+        dtend = ev.get("DTEND")
+        ev_begin = dtstart.dt if dtstart is not None else None
+        ev_end = dtend.dt if dtend is not None else None
+
+        # All-day events carry a bare date; promote to local midnight
+        if type(ev_begin) is date:
+            ev_begin = datetime(ev_begin.year, ev_begin.month, ev_begin.day, tzinfo=local_tz)
+        if type(ev_end) is date:
+            ev_end = datetime(ev_end.year, ev_end.month, ev_end.day, tzinfo=local_tz)
 
         # If naive, interpret as local_tz
         if isinstance(ev_begin, datetime):
             if ev_begin.tzinfo is None:
                 ev_begin = ev_begin.replace(tzinfo=local_tz)
-            else:
+            elif ev_begin.tzinfo is not local_tz:
                 # convert to local tz for consistent grouping/display
                 try:
                     ev_begin = ev_begin.astimezone(local_tz)
@@ -93,52 +104,54 @@ def load_ics_file(path: Path) -> list:
         if isinstance(ev_end, datetime):
             if ev_end.tzinfo is None:
                 ev_end = ev_end.replace(tzinfo=local_tz)
-            else:
+            elif ev_end.tzinfo is not local_tz:
                 try:
                     ev_end = ev_end.astimezone(local_tz)
                 except Exception:
                     pass
 
-        events.append({
-            "title": ev.name or "Untitled",
-            "begin": ev_begin,
-            "end": ev_end
-        })
-
-    # sort events by begin time
-    events.sort(key=lambda e: e["begin"] or datetime.min)
+        summary = ev.get("SUMMARY")
+        events.append(Event(
+            title=str(summary) if summary else "Untitled",
+            begin=ev_begin,
+            end=ev_end,
+        ))
+
+    # Drop events with no begin time (they are skipped when grouping
+    # anyway), then sort with a C-level key instead of a Python lambda
+    events = [e for e in events if e.begin is not None]
+    events.sort(key=attrgetter("begin"))
     return events
 
 
-def filter_future_events(events) -> list:
-    
-    """Return only events that are today or in the future."""
-    now = datetime.now(TIMEZONE)
-    return [e for e in events if e["begin"].date() >= now.date()]
-
-
 def group_events_by_date(events: list) -> dict:
     """
-    Group events by calendar date (YYYY-MM-DD) in the local timezone.
-    Returns dict[str(date_iso)] -> list of event dicts for that date.
+    Group events by calendar date in the local timezone, keeping only
+    events that are today or in the future.
+    Returns dict[date] -> list of Events for that date.
     """
-    grouped = {}    
-    future_events = filter_future_events(events)
-    
-    for e in future_events:
-        begin = e.get("begin")
+    grouped = {}
+    today = datetime.now(TIMEZONE).date()  # computed once, not per event
+
+    # Filter and group in a single pass -- no intermediate "future" list
+    for e in events:
+        begin = e.begin
         if not isinstance(begin, datetime):
             continue
         # Use the date portion in local tz
         event_date = begin.date()  # datetime is already in local tz in load_ics_file
-        key = event_date.isoformat()
-        grouped.setdefault(key, []).append(e)
+        if event_date < today:
+            continue
+        # Key by the date object itself -- no isoformat/fromisoformat
+        # round-trip, and dates still sort chronologically
+        grouped.setdefault(event_date, []).append(e)
     return grouped
 
 
 def import_events_from_text():
     """Import events automatically from a .txt file with time/date patterns."""
-    
+    from tkinter import filedialog, messagebox
+
     events = []
     file_path = filedialog.askopenfilename(
         title="Select text file",
@@ -154,30 +167,28 @@ def import_events_from_text():
         messagebox.showerror("Error", f"Could not read file: {e}")
         return
 
-    # Pattern: "HH:MM-HH:MM DD.MM"
-    pattern = r"(\d{1,2}:\d{2})-(\d{1,2}:\d{2})\s*(\d{1,2}\.\d{1,2})"
-    matches = re.findall(pattern, text)
+    matches = _EVENT_RE.findall(text)
 
     if not matches:
         messagebox.showinfo("No Matches", "No valid time/date patterns found in the file.")
         return
 
     added = 0
+    year = datetime.now().year
     for start_str, end_str, date_str in matches:
         try:
-            date_full = f"{date_str}.{datetime.now().year}"
+            # Date components are plain ints -- no need to build a string
+            # and strptime it back
+            day, month = map(int, date_str.split("."))
 
-            start_dt = datetime.strptime(f"{date_full} {start_str}", "%d.%m.%Y %H:%M").replace(tzinfo=TIMEZONE)
-            end_dt = datetime.strptime(f"{date_full} {end_str}", "%d.%m.%Y %H:%M").replace(tzinfo=TIMEZONE)
+            sh, sm = map(int, start_str.split(":"))
+            eh, em = map(int, end_str.split(":"))
+            start_dt = datetime(year, month, day, sh, sm, tzinfo=TIMEZONE)
+            end_dt = datetime(year, month, day, eh, em, tzinfo=TIMEZONE)
 
-            cutoff = datetime.strptime("16:30", "%H:%M").time()
-            title = "X1" if start_dt.time() < cutoff else "X2"
+            title = "X1" if start_dt.time() < CUTOFF else "X2"
 
-            events.append({
-                "title": title,
-                "begin": start_dt,
-                "end": end_dt
-            })
+            events.append(Event(title=title, begin=start_dt, end=end_dt))
             added += 1
         except Exception as e:
             print(f"Skipping invalid pattern: {start_str}-{end_str} {date_str} ({e})")
@@ -191,48 +202,50 @@ def import_events_from_text():
 # ------------------------------
 # GUI / Drawing Functions
 # ------------------------------
-def create_day_card(parent, day_iso: str, events: list, card_size=180):
-    """
-    Create a square frame representing a day with its events.
-    - day_iso: 'YYYY-MM-DD'
-    - events: list of event dicts (title, begin, end)
-    """
-    frame = ttk.Frame(parent, width=card_size, height=card_size, relief="raised", borderwidth=2)
-    frame.grid_propagate(False)  # keep size fixed
+def _make_header_text(d: date) -> str:
+    """Build the date header for a day card ('Mon\\n01 Jan 2026')."""
+    # Module-level abbreviation snapshots instead of strftime (no locale
+    # lookup / format parsing per card)
+    return f"{_DAY_ABBR[d.weekday()]}\n{d.day:02d} {_MONTH_ABBR[d.month]} {d.year}"
 
-    # Date header
-    d = date.fromisoformat(day_iso)
-    header = ttk.Label(frame, text=d.strftime("%a\n%d %b %Y"), anchor="center", justify="center",
-                       font=("Segoe UI", 10, "bold"))
-    header.grid(row=0, column=0, padx=4, pady=(6, 2), sticky="n")
 
-    # Text area for events (use a label with wrapped text)
-    # Build a short textual summary of events for the day
+def _make_content_text(events: list) -> str:
+    """Build the wrapped event summary text for a day card."""
     lines = []
     for e in events:
-        begin = e.get("begin")
-        end = e.get("end")
+        begin = e.begin
+        end = e.end
         if isinstance(begin, datetime):
-            tstr = begin.strftime("%H:%M")
+            tstr = f"{begin.hour:02d}:{begin.minute:02d}"
             if isinstance(end, datetime):
-                tstr += "–" + end.strftime("%H:%M")
-            lines.append(f"{tstr} {e.get('title')}")
+                tstr += f"–{end.hour:02d}:{end.minute:02d}"
+            lines.append(f"{tstr} {e.title}")
         else:
-            lines.append(e.get("title"))
+            lines.append(e.title)
 
-    # Wrap each line so it fits in the card reasonably
-    wrapped_lines = []
-    for line in lines:
-        wrapped_lines.extend(textwrap.wrap(line, width=18))  # adjust width if you want more text
-    if not wrapped_lines:
-        wrapped_lines = ["(no details)"]
+    # No manual wrapping -- the canvas text item wraps at display time
+    # via its width= option, so a Python wrap pass would be double work
+    return "\n".join(lines[:10]) or "(no details)"  # cap lines to avoid overflow
 
-    content = "\n".join(wrapped_lines[:10])  # cap lines to avoid overflow
-    label = ttk.Label(frame, text=content, anchor="n", justify="left", wraplength=card_size - 16,
-                      font=("Segoe UI", 9))
-    label.grid(row=1, column=0, padx=8, pady=(2, 8), sticky="nw")
 
-    return frame
+def create_day_card(canvas, x: int, y: int, header_text: str, content_text: str, card_size=180):
+    """
+    Draw a square card for a day directly onto the canvas.
+    Three cheap canvas items per day instead of a ttk.Frame full of
+    widgets -- far fewer Tcl objects and no geometry management.
+    Text is prepared up front (_make_header_text / _make_content_text)
+    so this function only issues Tk calls.
+    """
+    # Items start hidden so Tk doesn't redraw after every card; the
+    # caller reveals the "card" tag once after the whole batch
+    canvas.create_rectangle(x, y, x + card_size, y + card_size, outline="black",
+                            tags=("card",), state="hidden")
+    canvas.create_text(x + card_size / 2, y + 6, text=header_text, anchor="n",
+                       justify="center", font=("Segoe UI", 10, "bold"),
+                       tags=("card",), state="hidden")
+    canvas.create_text(x + 8, y + 44, text=content_text, anchor="nw",
+                       justify="left", width=card_size - 16, font=("Segoe UI", 9),
+                       tags=("card",), state="hidden")
 
 
 def build_day_cards_gui(grouped_events: dict, events: list):
@@ -240,6 +253,9 @@ def build_day_cards_gui(grouped_events: dict, events: list):
     Build and show the main Tkinter window containing one square per date in grouped_events.
     Layout: wraps cards with a fixed number of columns depending on window width.
     """
+    import tkinter as tk
+    from tkinter import ttk
+
     root = tk.Tk()
     root.title("Event Days")
     padding = 12
@@ -262,9 +278,6 @@ def build_day_cards_gui(grouped_events: dict, events: list):
     scrollbar = ttk.Scrollbar(root, orient="vertical", command=canvas.yview)
     canvas.configure(yscrollcommand=scrollbar.set)
 
-    container = ttk.Frame(canvas)
-    container_id = canvas.create_window((0, 0), window=container, anchor="nw")
-
     canvas.pack(side="left", fill="both", expand=True, padx=(padding, 0), pady=padding)
     scrollbar.pack(side="right", fill="y", padx=(0, padding), pady=padding)
 
@@ -273,22 +286,24 @@ def build_day_cards_gui(grouped_events: dict, events: list):
     gap = 12
     cols = 3  # default columns; we'll adjust based on window width
 
-    # Render cards in a wrapping grid
-    day_keys = sorted(grouped_events.keys())  # iso date strings sorted
-    for idx, key in enumerate(day_keys):
+    # Prepare all card text in a pure-Python pass first, then render --
+    # keeps the Tk round-trips out of the string-building loop
+    prepared = [
+        (_make_header_text(day), _make_content_text(evs))
+        for day, evs in sorted(grouped_events.items())
+    ]
+
+    # Draw cards in a wrapping grid directly on the canvas
+    for idx, (header_text, content_text) in enumerate(prepared):
         r = idx // cols
         c = idx % cols
-        card = create_day_card(container, key, grouped_events[key], card_size=card_size)
-        card.grid(row=r, column=c, padx=(0 if c == 0 else gap), pady=(0 if r == 0 else gap))
+        x = c * (card_size + gap)
+        y = r * (card_size + gap)
+        create_day_card(canvas, x, y, header_text, content_text, card_size=card_size)
 
-    # Make sure canvas scrollregion updates
-    def on_configure(event):
-        canvas.configure(scrollregion=canvas.bbox("all"))
-        # Optionally adjust columns based on width:
-        # cols = max(1, event.width // (card_size + gap))
-        # (In this simple version we keep cols fixed.)
-
-    container.bind("<Configure>", on_configure)
+    # Reveal all cards and set the scrollregion once after drawing
+    canvas.itemconfigure("card", state="normal")
+    canvas.configure(scrollregion=canvas.bbox("all"))
 
     # Allow mousewheel scrolling
     def _on_mousewheel(event):
@@ -313,6 +328,9 @@ def main():
     - If missing, ask the user to pick an .ics file via file dialog.
     - Then group events by date and show the GUI with day-cards.
     """
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
+
     # Attempt to load default ICS from Downloads
     ics_path = DEFAULT_ICS_PATH
     if not ics_path.exists():